@@ -0,0 +1,181 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Compiled Dancing Links solution counter for Sudoku
+
+Build with `python setup.py build_ext --inplace`. SudokuGenerator uses it for
+uniqueness checks when it is available and falls back to sudoku_dlx otherwise.
+"""
+from libc.stdlib cimport malloc, free
+
+cdef enum:
+    N_COLUMNS = 324
+    N_OPTIONS = 729
+    N_NODES = 1 + N_COLUMNS + 4 * N_OPTIONS
+
+cdef struct Node:
+    Node *L
+    Node *R
+    Node *U
+    Node *D
+    Node *col
+    int row_id
+    int size
+
+cdef inline void cover(Node *c) noexcept nogil:
+    """Remove column c and every option that intersects it"""
+    cdef Node *i
+    cdef Node *j
+    c.R.L = c.L
+    c.L.R = c.R
+    i = c.D
+    while i != c:
+        j = i.R
+        while j != i:
+            j.D.U = j.U
+            j.U.D = j.D
+            j.col.size -= 1
+            j = j.R
+        i = i.D
+
+cdef inline void uncover(Node *c) noexcept nogil:
+    """Restore column c, undoing cover in reverse order"""
+    cdef Node *i
+    cdef Node *j
+    i = c.U
+    while i != c:
+        j = i.L
+        while j != i:
+            j.col.size += 1
+            j.D.U = j
+            j.U.D = j
+            j = j.L
+        i = i.U
+    c.R.L = c
+    c.L.R = c
+
+cdef int search(Node *root, int count, int limit) noexcept nogil:
+    """Algorithm X search; adds the solutions found to count, stopping at limit"""
+    cdef Node *best
+    cdef Node *c
+    cdef Node *r
+    cdef Node *j
+    if root.R == root:
+        return count + 1
+
+    # Choose the column with the fewest remaining options (MRV). A column
+    # with one option is a forced move and one with none is a dead end,
+    # so either stops the scan immediately
+    best = root.R
+    c = best.R
+    while c != root and best.size > 1:
+        if c.size < best.size:
+            best = c
+        c = c.R
+    if best.size == 0:
+        return count
+
+    cover(best)
+    r = best.D
+    while r != best and count < limit:
+        j = r.R
+        while j != r:
+            cover(j.col)
+            j = j.R
+
+        count = search(root, count, limit)
+
+        j = r.L
+        while j != r:
+            uncover(j.col)
+            j = j.L
+        r = r.D
+    uncover(best)
+    return count
+
+cdef void option_columns(int row, int col, int value, int *columns) noexcept nogil:
+    """Fill columns with the four constraint columns of placing value at (row, col)"""
+    cdef int box = (row // 3) * 3 + col // 3
+    columns[0] = row * 9 + col
+    columns[1] = 81 + row * 9 + value - 1
+    columns[2] = 162 + col * 9 + value - 1
+    columns[3] = 243 + box * 9 + value - 1
+
+def count_solutions(grid, int limit=2):
+    """Count the solutions of a flat 81-cell grid (0 marks an empty cell), stopping at limit"""
+    cdef int cells[81]
+    cdef char used[N_COLUMNS]
+    cdef int columns[4]
+    cdef int i, k, c, row, col, value, option, count
+    cdef Node *nodes
+    cdef Node *root
+    cdef Node *header
+    cdef Node *node
+    cdef Node *j
+
+    for i in range(81):
+        cells[i] = grid[i]
+
+    nodes = <Node *> malloc(N_NODES * sizeof(Node))
+    if nodes == NULL:
+        raise MemoryError()
+    try:
+        # Circular header list: root <-> 1 <-> ... <-> 324 <-> root
+        root = &nodes[0]
+        for c in range(N_COLUMNS + 1):
+            nodes[c].L = &nodes[c - 1 if c > 0 else N_COLUMNS]
+            nodes[c].R = &nodes[c + 1 if c < N_COLUMNS else 0]
+            nodes[c].U = &nodes[c]
+            nodes[c].D = &nodes[c]
+            nodes[c].col = &nodes[c]
+            nodes[c].row_id = -1
+            nodes[c].size = 0
+
+        # Option o owns nodes 1 + N_COLUMNS + 4 * o .. + 3
+        for option in range(N_OPTIONS):
+            row = option // 81
+            col = (option // 9) % 9
+            value = option % 9 + 1
+            option_columns(row, col, value, columns)
+            for k in range(4):
+                node = &nodes[1 + N_COLUMNS + 4 * option + k]
+                header = &nodes[columns[k] + 1]
+                node.col = header
+                node.row_id = option
+                node.size = 0
+                node.U = header.U
+                node.D = header
+                header.U.D = node
+                header.U = node
+                header.size += 1
+                node.L = &nodes[1 + N_COLUMNS + 4 * option + (k + 3) % 4]
+                node.R = &nodes[1 + N_COLUMNS + 4 * option + (k + 1) % 4]
+
+        # Preselect the givens; a given whose constraint is already covered
+        # conflicts with an earlier one and the puzzle has no solution
+        for c in range(N_COLUMNS):
+            used[c] = 0
+        for i in range(81):
+            value = cells[i]
+            if value == 0:
+                continue
+            if value < 0 or value > 9:
+                raise ValueError(f"Invalid cell value {value}")
+            row = i // 9
+            col = i % 9
+            option_columns(row, col, value, columns)
+            for k in range(4):
+                if used[columns[k]]:
+                    return 0
+                used[columns[k]] = 1
+            node = &nodes[1 + N_COLUMNS + 4 * (row * 81 + col * 9 + value - 1)]
+            cover(node.col)
+            j = node.R
+            while j != node:
+                cover(j.col)
+                j = j.R
+
+        with nogil:
+            count = search(root, 0, limit)
+        return count
+    finally:
+        free(nodes)
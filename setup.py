@@ -0,0 +1,12 @@
+"""
+Build script for the optional compiled exact-cover counter:
+
+    python setup.py build_ext --inplace
+"""
+from setuptools import setup, Extension
+from Cython.Build import cythonize
+
+setup(
+    name="sudoku-builder",
+    ext_modules=cythonize([Extension("_dlx", ["_dlx.pyx"])])
+)
@@ -3,9 +3,191 @@ Core Sudoku solving and generation algorithms
 """
 import numpy as np
 import random
-from typing import List, Tuple, Optional, Dict, Set
+from typing import List, Tuple, Optional, Dict, Set, Union
 from dataclasses import dataclass
 from enum import Enum
+from sudoku_dlx import DLX
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:  # numba is optional; the kernel below then runs as plain Python
+    HAVE_NUMBA = False
+
+try:
+    import _dlx  # Compiled solution counter, built with `python setup.py build_ext --inplace`
+except ImportError:
+    _dlx = None
+
+# Bitmask with one bit per digit: bit (d - 1) is set when digit d is possible
+ALL_CANDIDATES = 0x1FF
+
+# Lookup tables over all 512 masks: CANDS maps a used-digit mask to the digits
+# still free, POPCOUNT gives the number of digits in a mask
+CANDS = np.array([~i & ALL_CANDIDATES for i in range(512)], dtype=np.uint16)
+POPCOUNT = np.array([bin(i).count("1") for i in range(512)], dtype=np.int8)
+
+def popcount(mask: int) -> int:
+    """Count the digits present in a candidate bitmask"""
+    return int(POPCOUNT[mask])
+
+def mask_to_values(mask: int) -> Set[int]:
+    """Expand a candidate bitmask into the set of digits it contains"""
+    return {value for value in range(1, 10) if mask & (1 << (value - 1))}
+
+def _bit_positions(mask: int) -> List[int]:
+    """List the positions of the set bits of mask, lowest first"""
+    return [pos for pos in range(9) if mask & (1 << pos)]
+
+def _digits_text(mask: int) -> str:
+    """Format the digits of a candidate bitmask as '3 and 7' or '2, 5 and 8'"""
+    digits = [str(pos + 1) for pos in _bit_positions(mask)]
+    return ", ".join(digits[:-1]) + " and " + digits[-1] if len(digits) > 1 else "".join(digits)
+
+def _cells_text(cells: List[Tuple[int, int]]) -> str:
+    """Format cells as 1-based coordinates"""
+    return ", ".join(f"({row+1}, {col+1})" for row, col in cells)
+
+def _unit_name(unit: int) -> str:
+    """Name one of the 27 units (0-8 rows, 9-17 columns, 18-26 boxes)"""
+    kind, index = divmod(unit, 9)
+    return f"{('row', 'column', 'box')[kind]} {index + 1}"
+
+# Positions inside a box (as used by box_place) covered by each box row and box column
+BOX_ROW_BITS = (0b000000111, 0b000111000, 0b111000000)
+BOX_COL_BITS = (0b001001001, 0b010010010, 0b100100100)
+
+def _build_units() -> np.ndarray:
+    """List the flat cell indices of the 9 rows, 9 columns and 9 boxes"""
+    rows = [[i * 9 + j for j in range(9)] for i in range(9)]
+    cols = [[i * 9 + j for i in range(9)] for j in range(9)]
+    boxes = [[(box_row + i) * 9 + box_col + j for i in range(3) for j in range(3)]
+             for box_row in range(0, 9, 3) for box_col in range(0, 9, 3)]
+    return np.array(rows + cols + boxes, dtype=np.int8)
+
+def _build_peers() -> np.ndarray:
+    """List the flat indices of the 20 cells sharing a row, column or box with each cell"""
+    peers = np.zeros((81, 20), dtype=np.int8)
+    for idx in range(81):
+        row, col = divmod(idx, 9)
+        box = (row // 3) * 3 + col // 3
+        cells = set(UNITS[row]) | set(UNITS[9 + col]) | set(UNITS[18 + box])
+        cells.discard(idx)
+        peers[idx] = sorted(cells)
+    return peers
+
+# Static index tables for the 9x9 grid, computed once at import
+UNITS = _build_units()
+PEERS = _build_peers()
+
+# Row, column and box index of every cell in row-major order
+CELL_TO_ROW = np.repeat(np.arange(9, dtype=np.int8), 9)
+CELL_TO_COL = np.tile(np.arange(9, dtype=np.int8), 9)
+CELL_TO_BOX = np.array([(i // 3) * 3 + j // 3 for i in range(9) for j in range(9)], dtype=np.int8)
+# Position (0-8) of every cell inside its box
+CELL_TO_BOX_POS = np.array([(i % 3) * 3 + j % 3 for i in range(9) for j in range(9)], dtype=np.int8)
+
+def _grid_masks(flat: np.ndarray, dtype=np.int16) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Build the used-digit bitmasks of every row, column and box of a flat grid"""
+    filled = np.flatnonzero(flat)
+    bits = np.left_shift(1, flat[filled].astype(dtype) - 1).astype(dtype)
+    masks = []
+    for cell_to_unit in (CELL_TO_ROW, CELL_TO_COL, CELL_TO_BOX):
+        mask = np.zeros(9, dtype=dtype)
+        np.bitwise_or.at(mask, cell_to_unit[filled], bits)
+        masks.append(mask)
+    return tuple(masks)
+
+def _solve_flat(grid, row_mask, col_mask, box_mask, out, limit):
+    """Bitmask backtracking over a flat int8[81] grid.
+
+    Counts up to limit solutions and returns how many were found, writing the
+    first out.shape[0] of them into the rows of out (pass an empty out to only
+    count). The grid and masks are restored before returning.
+    Written iteratively over plain arrays so numba can compile it.
+    """
+    empties = np.empty(81, dtype=np.int64)
+    n = 0
+    for i in range(81):
+        if grid[i] == 0:
+            empties[n] = i
+            n += 1
+    
+    count = 0
+    depth = 0
+    while depth >= 0:
+        if depth == n:
+            if count < out.shape[0]:
+                out[count, :] = grid
+            count += 1
+            if count >= limit:
+                break
+            depth -= 1
+            continue
+        
+        i = empties[depth]
+        row = i // 9
+        col = i % 9
+        box = (row // 3) * 3 + col // 3
+        value = int(grid[i])
+        if value != 0:
+            # Undo the previous attempt at this depth before trying the next digit
+            bit = 1 << (value - 1)
+            row_mask[row] ^= bit
+            col_mask[col] ^= bit
+            box_mask[box] ^= bit
+            grid[i] = 0
+        
+        used = row_mask[row] | col_mask[col] | box_mask[box]
+        value += 1
+        while value <= 9 and (used >> (value - 1)) & 1:
+            value += 1
+        if value > 9:
+            depth -= 1
+            continue
+        
+        bit = 1 << (value - 1)
+        row_mask[row] |= bit
+        col_mask[col] |= bit
+        box_mask[box] |= bit
+        grid[i] = value
+        depth += 1
+    
+    # Unwind any placements left when the search stopped early
+    for k in range(n):
+        i = empties[k]
+        value = int(grid[i])
+        if value != 0:
+            row = i // 9
+            col = i % 9
+            bit = 1 << (value - 1)
+            row_mask[row] ^= bit
+            col_mask[col] ^= bit
+            box_mask[(row // 3) * 3 + col // 3] ^= bit
+            grid[i] = 0
+    return count
+
+_solve_nb = njit(cache=True)(_solve_flat) if HAVE_NUMBA else _solve_flat
+
+def _kernel_solve(grid: np.ndarray, limit: int, masks: Optional[Tuple[np.ndarray, ...]] = None) -> np.ndarray:
+    """Run the backtracking kernel on a 9x9 grid, returning the solutions found.
+
+    masks are the grid's int16 row, column and box masks when the caller already
+    tracks them; the kernel restores them before returning.
+    """
+    flat = np.ascontiguousarray(grid, dtype=np.int8).ravel()
+    if masks is None:
+        masks = _grid_masks(flat)
+    out = np.zeros((limit, 81), dtype=np.int8)
+    count = _solve_nb(flat, *masks, out, limit)
+    return out[:count].reshape(count, 9, 9)
+
+def _kernel_count(grid: np.ndarray, limit: int, masks: Optional[Tuple[np.ndarray, ...]] = None) -> int:
+    """Count the solutions of a 9x9 grid with the backtracking kernel, stopping at limit"""
+    flat = np.ascontiguousarray(grid, dtype=np.int8).ravel()
+    if masks is None:
+        masks = _grid_masks(flat)
+    return _solve_nb(flat, *masks, np.empty((0, 81), dtype=np.int8), limit)
 
 class Difficulty(Enum):
     EASY = 1
@@ -15,16 +197,16 @@ class Difficulty(Enum):
 
 @dataclass
 class Cell:
-    """Represents a single cell in the Sudoku grid"""
+    """Represents a single cell in the Sudoku grid (a view built by SudokuSolver.get_cell)"""
     row: int
     col: int
     value: int = 0
-    candidates: Set[int] = None
+    candidates: int = ALL_CANDIDATES
     is_given: bool = False
     
     def __post_init__(self):
-        if self.candidates is None:
-            self.candidates = set(range(1, 10)) if self.value == 0 else set()
+        if self.value != 0:
+            self.candidates = 0
 
 @dataclass
 class Technique:
@@ -34,45 +216,66 @@ class Technique:
     cells_affected: List[Tuple[int, int]]
     values_removed: Set[int]
     explanation: str
+    value: int = 0  # Digit placed in cells_affected, 0 if nothing is placed
 
 class SudokuSolver:
     """Main Sudoku solving engine with educational features"""
     
+    # Technique finders in order of difficulty; singles come from one fused scan
+    _TECHNIQUES = (
+        '_scan_board',
+        '_find_naked_pair',
+        '_find_hidden_pair',
+        '_find_pointing_pair',
+        '_find_box_line_reduction'
+    )
+    
     def __init__(self):
-        self.grid = np.zeros((9, 9), dtype=int)
-        self.cells = [[Cell(i, j) for j in range(9)] for i in range(9)]
+        self.grid = np.zeros((9, 9), dtype=np.int8)
+        # Per-cell state as flat arrays indexed by row * 9 + col; values is a view of grid
+        self.values = self.grid.reshape(81)
+        self.candidates = np.zeros(81, dtype=np.uint16)
+        self.is_given = np.zeros(81, dtype=bool)
         self.techniques_used = []
-        
-    def load_puzzle(self, puzzle: List[List[int]]):
-        """Load a puzzle into the solver"""
-        self.grid = np.array(puzzle)
-        for i in range(9):
-            for j in range(9):
-                self.cells[i][j] = Cell(i, j, puzzle[i][j], is_given=(puzzle[i][j] != 0))
-                if puzzle[i][j] == 0:
-                    self.cells[i][j].candidates = self._get_candidates(i, j)
-                else:
-                    self.cells[i][j].candidates = set()
+        # Bitmasks of the digits already used in each row, column and box
+        self.row_mask = np.zeros(9, dtype=np.uint16)
+        self.col_mask = np.zeros(9, dtype=np.uint16)
+        self.box_mask = np.zeros(9, dtype=np.uint16)
+        # Placement bitmaps: row_place[r, d-1] has bit c set when d is a candidate
+        # at (r, c); col_place is indexed by row and box_place by position in box
+        self.row_place = np.zeros((9, 9), dtype=np.uint16)
+        self.col_place = np.zeros((9, 9), dtype=np.uint16)
+        self.box_place = np.zeros((9, 9), dtype=np.uint16)
+        # Placements only ever use current candidates, so a grid that was valid
+        # when loaded stays valid and only the empty cells need counting
+        self._trust_valid = True
+        self._empty_count = 81
+        
+    def load_puzzle(self, puzzle: Union[np.ndarray, List[List[int]]]):
+        """Load a puzzle (9x9 array or nested lists) into the solver"""
+        self.grid = np.array(puzzle, dtype=np.int8)
+        self.values = self.grid.reshape(81)
+        self.is_given = self.values != 0
+        self.row_mask, self.col_mask, self.box_mask = _grid_masks(self.values, np.uint16)
+        self._trust_valid = self.is_valid()
+        self._empty_count = 81 - int(np.count_nonzero(self.is_given))
+        
+        # Candidates are computed once here and then maintained incrementally
+        self._update_all_candidates()
+        self._update_places()
     
-    def _get_candidates(self, row: int, col: int) -> Set[int]:
-        """Get possible candidates for a cell"""
-        if self.grid[row, col] != 0:
-            return set()
-        
-        candidates = set(range(1, 10))
-        
-        # Remove values from row
-        candidates -= set(self.grid[row, :])
-        
-        # Remove values from column
-        candidates -= set(self.grid[:, col])
-        
-        # Remove values from 3x3 box
-        box_row, box_col = (row // 3) * 3, (col // 3) * 3
-        box_values = set(self.grid[box_row:box_row+3, box_col:box_col+3].flatten())
-        candidates -= box_values
+    def get_cell(self, row: int, col: int) -> Cell:
+        """Build a Cell view of the solver state at (row, col)"""
+        idx = row * 9 + col
+        return Cell(row, col, int(self.values[idx]), int(self.candidates[idx]), bool(self.is_given[idx]))
+    
+    def _get_candidates(self, row: int, col: int) -> int:
+        """Get the candidate bitmask for a cell"""
+        idx = row * 9 + col
+        if self.values[idx] != 0:
+            return 0
         
-        return candidates
+        return int(CANDS[self.row_mask[row] | self.col_mask[col] | self.box_mask[CELL_TO_BOX[idx]]])
     
     def solve_with_techniques(self) -> List[Technique]:
         """Solve the puzzle step by step, recording techniques used"""
@@ -94,206 +297,317 @@ class SudokuSolver:
     
     def _find_next_technique(self) -> Optional[Technique]:
         """Find the next technique that can be applied"""
-        # Update all candidates first
-        self._update_all_candidates()
-        
-        # Try techniques in order of difficulty
-        techniques = [
-            self._find_naked_single,
-            self._find_hidden_single,
-            self._find_naked_pair,
-            self._find_hidden_pair,
-            self._find_pointing_pair,
-            self._find_box_line_reduction
-        ]
-        
-        for technique_func in techniques:
-            technique = technique_func()
+        for name in self._TECHNIQUES:
+            technique = getattr(self, name)()
             if technique:
                 return technique
         
         return None
     
-    def _find_naked_single(self) -> Optional[Technique]:
-        """Find cells with only one candidate (naked single)"""
-        for i in range(9):
-            for j in range(9):
-                if self.grid[i, j] == 0 and len(self.cells[i][j].candidates) == 1:
-                    value = list(self.cells[i][j].candidates)[0]
-                    return Technique(
-                        name="Naked Single",
-                        description=f"Cell ({i+1}, {j+1}) can only contain {value}",
-                        cells_affected=[(i, j)],
-                        values_removed=set(),
-                        explanation=f"Cell ({i+1}, {j+1}) has only one possible value: {value}"
-                    )
-        return None
+    def _scan_board(self) -> Optional[Technique]:
+        """Find naked and hidden singles in a single pass over the bitmaps"""
+        # The 81 cell candidate masks followed by the row, column and box
+        # placement bitmaps, so the first hit respects the technique order
+        masks = np.concatenate((
+            self.candidates,
+            self.row_place.ravel(),
+            self.col_place.ravel(),
+            self.box_place.ravel()
+        ))
+        singles = POPCOUNT[masks] == 1
+        if not singles.any():
+            return None
+        
+        hit = int(np.argmax(singles))
+        if hit < 81:
+            i, j = divmod(hit, 9)
+            value = int(masks[hit]).bit_length()
+            return Technique(
+                name="Naked Single",
+                description=f"Cell ({i+1}, {j+1}) can only contain {value}",
+                cells_affected=[(i, j)],
+                values_removed=set(),
+                explanation=f"Cell ({i+1}, {j+1}) has only one possible value: {value}",
+                value=value
+            )
+        
+        kind, offset = divmod(hit - 81, 81)
+        unit, digit = divmod(offset, 9)
+        value, pos = digit + 1, int(masks[hit]).bit_length() - 1
+        if kind == 0:
+            row, col = unit, pos
+            return Technique(
+                name="Hidden Single (Row)",
+                description=f"Value {value} can only go in cell ({row+1}, {col+1}) in row {row+1}",
+                cells_affected=[(row, col)],
+                values_removed=set(),
+                explanation=f"In row {row+1}, value {value} can only be placed in cell ({row+1}, {col+1})",
+                value=value
+            )
+        if kind == 1:
+            row, col = pos, unit
+            return Technique(
+                name="Hidden Single (Column)",
+                description=f"Value {value} can only go in cell ({row+1}, {col+1}) in column {col+1}",
+                cells_affected=[(row, col)],
+                values_removed=set(),
+                explanation=f"In column {col+1}, value {value} can only be placed in cell ({row+1}, {col+1})",
+                value=value
+            )
+        row, col = (unit // 3) * 3 + pos // 3, (unit % 3) * 3 + pos % 3
+        return Technique(
+            name="Hidden Single (Box)",
+            description=f"Value {value} can only go in cell ({row+1}, {col+1}) in box",
+            cells_affected=[(row, col)],
+            values_removed=set(),
+            explanation=f"In the 3x3 box, value {value} can only be placed in cell ({row+1}, {col+1})",
+            value=value
+        )
     
-    def _find_hidden_single(self) -> Optional[Technique]:
-        """Find hidden singles in rows, columns, and boxes"""
-        # Check rows
-        for i in range(9):
-            for value in range(1, 10):
-                if value not in self.grid[i, :]:
-                    positions = []
-                    for j in range(9):
-                        if self.grid[i, j] == 0 and value in self.cells[i][j].candidates:
-                            positions.append((i, j))
-                    if len(positions) == 1:
-                        row, col = positions[0]
-                        return Technique(
-                            name="Hidden Single (Row)",
-                            description=f"Value {value} can only go in cell ({row+1}, {col+1}) in row {row+1}",
-                            cells_affected=[(row, col)],
-                            values_removed=set(),
-                            explanation=f"In row {row+1}, value {value} can only be placed in cell ({row+1}, {col+1})"
-                        )
-        
-        # Check columns
-        for j in range(9):
-            for value in range(1, 10):
-                if value not in self.grid[:, j]:
-                    positions = []
-                    for i in range(9):
-                        if self.grid[i, j] == 0 and value in self.cells[i][j].candidates:
-                            positions.append((i, j))
-                    if len(positions) == 1:
-                        row, col = positions[0]
-                        return Technique(
-                            name="Hidden Single (Column)",
-                            description=f"Value {value} can only go in cell ({row+1}, {col+1}) in column {col+1}",
-                            cells_affected=[(row, col)],
-                            values_removed=set(),
-                            explanation=f"In column {col+1}, value {value} can only be placed in cell ({row+1}, {col+1})"
-                        )
-        
-        # Check boxes
-        for box_row in range(0, 9, 3):
-            for box_col in range(0, 9, 3):
-                for value in range(1, 10):
-                    box_values = set(self.grid[box_row:box_row+3, box_col:box_col+3].flatten())
-                    if value not in box_values:
-                        positions = []
-                        for i in range(box_row, box_row+3):
-                            for j in range(box_col, box_col+3):
-                                if self.grid[i, j] == 0 and value in self.cells[i][j].candidates:
-                                    positions.append((i, j))
-                        if len(positions) == 1:
-                            row, col = positions[0]
-                            return Technique(
-                                name="Hidden Single (Box)",
-                                description=f"Value {value} can only go in cell ({row+1}, {col+1}) in box",
-                                cells_affected=[(row, col)],
-                                values_removed=set(),
-                                explanation=f"In the 3x3 box, value {value} can only be placed in cell ({row+1}, {col+1})"
-                            )
-        return None
+    def _unit_places(self) -> np.ndarray:
+        """Placement bitmaps of all 27 units; bit p of [unit, d-1] refers to cell UNITS[unit][p]"""
+        return np.concatenate((self.row_place, self.col_place, self.box_place))
     
     def _find_naked_pair(self) -> Optional[Technique]:
         """Find naked pairs (two cells with same two candidates)"""
-        # This is a simplified version - full implementation would be more complex
+        for unit in range(27):
+            cells = UNITS[unit]
+            candidates = self.candidates[cells]
+            pairs = np.flatnonzero(POPCOUNT[candidates] == 2)
+            for a in range(len(pairs)):
+                for b in range(a + 1, len(pairs)):
+                    pair_mask = int(candidates[pairs[a]])
+                    if int(candidates[pairs[b]]) != pair_mask:
+                        continue
+                    # Other cells of the unit that still hold either digit
+                    targets = [divmod(int(cells[k]), 9) for k in range(9)
+                               if k != pairs[a] and k != pairs[b] and candidates[k] & pair_mask]
+                    if not targets:
+                        continue
+                    pair_cells = [divmod(int(cells[pairs[a]]), 9), divmod(int(cells[pairs[b]]), 9)]
+                    digits = _digits_text(pair_mask)
+                    return Technique(
+                        name="Naked Pair",
+                        description=f"Cells {_cells_text(pair_cells)} in {_unit_name(unit)} both contain only {digits}",
+                        cells_affected=targets,
+                        values_removed=mask_to_values(pair_mask),
+                        explanation=f"{digits} must go in cells {_cells_text(pair_cells)}, "
+                                    f"so they can be removed from cells {_cells_text(targets)}"
+                    )
         return None
     
     def _find_hidden_pair(self) -> Optional[Technique]:
         """Find hidden pairs"""
+        unit_places = self._unit_places()
+        for unit in range(27):
+            places = unit_places[unit]
+            digits = np.flatnonzero(POPCOUNT[places] == 2)
+            for a in range(len(digits)):
+                for b in range(a + 1, len(digits)):
+                    position_mask = int(places[digits[a]])
+                    if int(places[digits[b]]) != position_mask:
+                        continue
+                    pair_mask = (1 << int(digits[a])) | (1 << int(digits[b]))
+                    pair_idx = [int(UNITS[unit][pos]) for pos in _bit_positions(position_mask)]
+                    extra = 0
+                    for idx in pair_idx:
+                        extra |= int(self.candidates[idx]) & ~pair_mask
+                    if not extra:
+                        continue
+                    pair_cells = [divmod(idx, 9) for idx in pair_idx]
+                    pair_digits = _digits_text(pair_mask)
+                    return Technique(
+                        name="Hidden Pair",
+                        description=f"In {_unit_name(unit)}, {pair_digits} only fit in cells {_cells_text(pair_cells)}",
+                        cells_affected=pair_cells,
+                        values_removed=mask_to_values(extra),
+                        explanation=f"{pair_digits} must occupy cells {_cells_text(pair_cells)}, "
+                                    f"so every other candidate can be removed from those cells"
+                    )
         return None
     
     def _find_pointing_pair(self) -> Optional[Technique]:
         """Find pointing pairs/triples"""
+        for box in range(9):
+            box_row, box_col = (box // 3) * 3, (box % 3) * 3
+            for digit in range(9):
+                places = int(self.box_place[box, digit])
+                if popcount(places) < 2:
+                    continue
+                value = digit + 1
+                for k in range(3):
+                    if not places & ~BOX_ROW_BITS[k]:
+                        # Confined to one row of the box: clear the rest of that row
+                        row = box_row + k
+                        outside = int(self.row_place[row, digit]) & ~(0b111 << box_col)
+                        targets = [(row, col) for col in _bit_positions(outside)]
+                        line = f"row {row+1}"
+                    elif not places & ~BOX_COL_BITS[k]:
+                        # Confined to one column of the box: clear the rest of that column
+                        col = box_col + k
+                        outside = int(self.col_place[col, digit]) & ~(0b111 << box_row)
+                        targets = [(row, col) for row in _bit_positions(outside)]
+                        line = f"column {col+1}"
+                    else:
+                        continue
+                    if targets:
+                        return Technique(
+                            name="Pointing Pair" if popcount(places) == 2 else "Pointing Triple",
+                            description=f"In box {box+1}, value {value} is confined to {line}",
+                            cells_affected=targets,
+                            values_removed={value},
+                            explanation=f"Value {value} must go in {line} inside box {box+1}, "
+                                        f"so it can be removed from cells {_cells_text(targets)}"
+                        )
         return None
     
     def _find_box_line_reduction(self) -> Optional[Technique]:
         """Find box/line reduction"""
+        for line in range(18):
+            is_row, index = line < 9, line % 9
+            line_place = self.row_place if is_row else self.col_place
+            for digit in range(9):
+                places = int(line_place[index, digit])
+                if popcount(places) < 2:
+                    continue
+                for k in range(3):
+                    if places & ~(0b111 << (3 * k)):
+                        continue
+                    # Confined to one box: clear the rest of that box
+                    if is_row:
+                        box = (index // 3) * 3 + k
+                        outside = int(self.box_place[box, digit]) & ~BOX_ROW_BITS[index % 3]
+                    else:
+                        box = k * 3 + index // 3
+                        outside = int(self.box_place[box, digit]) & ~BOX_COL_BITS[index % 3]
+                    box_row, box_col = (box // 3) * 3, (box % 3) * 3
+                    targets = [(box_row + pos // 3, box_col + pos % 3) for pos in _bit_positions(outside)]
+                    if targets:
+                        value, name = digit + 1, _unit_name(line)
+                        return Technique(
+                            name="Box/Line Reduction",
+                            description=f"In {name}, value {value} is confined to box {box+1}",
+                            cells_affected=targets,
+                            values_removed={value},
+                            explanation=f"Value {value} must go in box {box+1} within {name}, "
+                                        f"so it can be removed from cells {_cells_text(targets)}"
+                        )
         return None
     
     def _apply_technique(self, technique: Technique):
         """Apply a solving technique to the grid"""
-        for row, col in technique.cells_affected:
-            if len(self.cells[row][col].candidates) == 1:
-                value = list(self.cells[row][col].candidates)[0]
-                self.grid[row, col] = value
-                self.cells[row][col].value = value
-                self.cells[row][col].candidates = set()
+        if technique.value:
+            for row, col in technique.cells_affected:
+                self._place(row, col, technique.value)
+        else:
+            # Elimination techniques only remove candidates
+            mask = sum(1 << (value - 1) for value in technique.values_removed)
+            for row, col in technique.cells_affected:
+                self._eliminate(row * 9 + col, mask)
+    
+    def _place(self, row: int, col: int, value: int):
+        """Place a value and remove it from the candidates of its 20 peers"""
+        idx = row * 9 + col
+        bit = 1 << (value - 1)
+        self._eliminate(idx, ALL_CANDIDATES)
+        self.values[idx] = value
+        self._empty_count -= 1
+        self.row_mask[row] |= bit
+        self.col_mask[col] |= bit
+        self.box_mask[CELL_TO_BOX[idx]] |= bit
+        
+        peers = PEERS[idx]
+        for peer in peers[(self.candidates[peers] & bit) != 0]:
+            self._eliminate(int(peer), bit)
+    
+    def _eliminate(self, idx: int, mask: int):
+        """Remove the digits in mask from the candidates of cell idx and its placement bitmaps"""
+        removed = int(self.candidates[idx]) & mask
+        if not removed:
+            return
+        self.candidates[idx] ^= removed
+        
+        row, col = divmod(idx, 9)
+        box, pos = int(CELL_TO_BOX[idx]), int(CELL_TO_BOX_POS[idx])
+        while removed:
+            bit = removed & -removed
+            digit = bit.bit_length() - 1
+            self.row_place[row, digit] &= ALL_CANDIDATES ^ (1 << col)
+            self.col_place[col, digit] &= ALL_CANDIDATES ^ (1 << row)
+            self.box_place[box, digit] &= ALL_CANDIDATES ^ (1 << pos)
+            removed ^= bit
     
     def _update_all_candidates(self):
-        """Update candidates for all empty cells"""
-        for i in range(9):
-            for j in range(9):
-                if self.grid[i, j] == 0:
-                    self.cells[i][j].candidates = self._get_candidates(i, j)
+        """Recompute candidates for all empty cells from the row, column and box masks"""
+        used = self.row_mask[CELL_TO_ROW] | self.col_mask[CELL_TO_COL] | self.box_mask[CELL_TO_BOX]
+        self.candidates = np.where(self.values == 0, CANDS[used], 0).astype(np.uint16)
+    
+    def _update_places(self):
+        """Rebuild the row, column and box placement bitmaps from the candidates"""
+        # has[idx, d] is 1 when digit d + 1 is a candidate of cell idx
+        has = (self.candidates[:, None] >> np.arange(9, dtype=np.uint16)) & 1
+        shifts = np.arange(9, dtype=np.uint16)[None, :, None]
+        self.row_place = (has.reshape(9, 9, 9) << shifts).sum(axis=1, dtype=np.uint16)
+        self.col_place = (has.reshape(9, 9, 9).swapaxes(0, 1) << shifts).sum(axis=1, dtype=np.uint16)
+        self.box_place = (has[UNITS[18:]] << shifts).sum(axis=1, dtype=np.uint16)
     
     def _backtrack_solve(self) -> bool:
-        """Solve using backtracking algorithm"""
-        def is_valid(row, col, num):
-            # Check row
-            if num in self.grid[row, :]:
-                return False
-            
-            # Check column
-            if num in self.grid[:, col]:
+        """Solve the remaining cells, with the compiled kernel when numba is available"""
+        if HAVE_NUMBA:
+            # The kernel trusts the givens, so reject conflicting ones up front
+            if not self.is_valid():
                 return False
-            
-            # Check 3x3 box
-            box_row, box_col = (row // 3) * 3, (col // 3) * 3
-            if num in self.grid[box_row:box_row+3, box_col:box_col+3]:
-                return False
-            
-            return True
-        
-        def solve():
-            for i in range(9):
-                for j in range(9):
-                    if self.grid[i, j] == 0:
-                        for num in range(1, 10):
-                            if is_valid(i, j, num):
-                                self.grid[i, j] = num
-                                if solve():
-                                    return True
-                                self.grid[i, j] = 0
-                        return False
-            return True
-        
-        return solve()
+            solutions = _kernel_solve(self.grid, 1)
+        else:
+            solutions = DLX().solve(self.grid, limit=1)
+        if len(solutions) == 0:
+            return False
+        self.grid[:, :] = solutions[0]
+        self._empty_count = 0
+        return True
     
     def is_solved(self) -> bool:
         """Check if the puzzle is completely solved"""
-        return np.all(self.grid != 0) and self.is_valid()
+        return self._empty_count == 0 and (self._trust_valid or self.is_valid())
     
     def is_valid(self) -> bool:
         """Check if the current grid is valid"""
-        # Check rows
-        for i in range(9):
-            row = self.grid[i, :]
-            if len(set(row[row != 0])) != len(row[row != 0]):
-                return False
+        # Gather the 9 rows, 9 columns and 9 boxes into a (27, 9) array of units
+        units = self.values[UNITS]
         
-        # Check columns
-        for j in range(9):
-            col = self.grid[:, j]
-            if len(set(col[col != 0])) != len(col[col != 0]):
-                return False
-        
-        # Check 3x3 boxes
-        for i in range(0, 9, 3):
-            for j in range(0, 9, 3):
-                box = self.grid[i:i+3, j:j+3].flatten()
-                if len(set(box[box != 0])) != len(box[box != 0]):
-                    return False
-        
-        return True
+        # counts[u, d-1] is how many times digit d appears in unit u
+        counts = (units[:, None, :] == np.arange(1, 10)[None, :, None]).sum(axis=2)
+        return bool((counts <= 1).all())
     
     def get_hint(self) -> Optional[Technique]:
         """Get the next hint for the user"""
-        self._update_all_candidates()
         return self._find_next_technique()
 
 class SudokuGenerator:
     """Generate Sudoku puzzles of varying difficulty"""
     
+    # Solved grid that every complete grid is derived from
+    CANONICAL = np.array([
+        [1, 2, 3, 4, 5, 6, 7, 8, 9],
+        [4, 5, 6, 7, 8, 9, 1, 2, 3],
+        [7, 8, 9, 1, 2, 3, 4, 5, 6],
+        [2, 3, 4, 5, 6, 7, 8, 9, 1],
+        [5, 6, 7, 8, 9, 1, 2, 3, 4],
+        [8, 9, 1, 2, 3, 4, 5, 6, 7],
+        [3, 4, 5, 6, 7, 8, 9, 1, 2],
+        [6, 7, 8, 9, 1, 2, 3, 4, 5],
+        [9, 1, 2, 3, 4, 5, 6, 7, 8]
+    ], dtype=np.int8)
+    
     def __init__(self):
         self.solver = SudokuSolver()
+        self.dlx = DLX()
+        # Used-digit bitmasks of the puzzle being carved in _remove_numbers
+        self.row_mask = np.zeros(9, dtype=np.int16)
+        self.col_mask = np.zeros(9, dtype=np.int16)
+        self.box_mask = np.zeros(9, dtype=np.int16)
     
-    def generate_puzzle(self, difficulty: Difficulty = Difficulty.MEDIUM) -> List[List[int]]:
+    def generate_puzzle(self, difficulty: Difficulty = Difficulty.MEDIUM) -> np.ndarray:
         """Generate a Sudoku puzzle of specified difficulty"""
         # Start with a complete solved grid
         complete_grid = self._generate_complete_grid()
@@ -301,64 +615,31 @@ class SudokuGenerator:
         # Remove numbers based on difficulty
         puzzle = self._remove_numbers(complete_grid, difficulty)
         
-        return puzzle.tolist()
+        return puzzle
     
     def _generate_complete_grid(self) -> np.ndarray:
         """Generate a complete, valid Sudoku grid"""
-        grid = np.zeros((9, 9), dtype=int)
-        
-        # Fill diagonal 3x3 boxes first (they don't interfere with each other)
-        for i in range(0, 9, 3):
-            self._fill_box(grid, i, i)
-        
-        # Fill remaining cells using backtracking
-        self._fill_remaining(grid)
-        
-        return grid
+        # Relabelling digits, shuffling rows within bands and columns within
+        # stacks, shuffling the bands and stacks themselves and transposing
+        # all keep a solved grid solved
+        digits = np.array(random.sample(range(1, 10), 9), dtype=np.int8)
+        rows = self._shuffled_lines()
+        cols = self._shuffled_lines()
+        grid = digits[self.CANONICAL - 1][np.ix_(rows, cols)]
+        if random.random() < 0.5:
+            grid = grid.T
+        return np.ascontiguousarray(grid)
     
-    def _fill_box(self, grid: np.ndarray, row: int, col: int):
-        """Fill a 3x3 box with numbers 1-9"""
-        numbers = list(range(1, 10))
-        random.shuffle(numbers)
-        
-        for i in range(3):
-            for j in range(3):
-                grid[row + i, col + j] = numbers[i * 3 + j]
-    
-    def _fill_remaining(self, grid: np.ndarray) -> bool:
-        """Fill remaining cells using backtracking"""
-        for i in range(9):
-            for j in range(9):
-                if grid[i, j] == 0:
-                    for num in range(1, 10):
-                        if self._is_safe(grid, i, j, num):
-                            grid[i, j] = num
-                            if self._fill_remaining(grid):
-                                return True
-                            grid[i, j] = 0
-                    return False
-        return True
-    
-    def _is_safe(self, grid: np.ndarray, row: int, col: int, num: int) -> bool:
-        """Check if it's safe to place a number at given position"""
-        # Check row
-        if num in grid[row, :]:
-            return False
-        
-        # Check column
-        if num in grid[:, col]:
-            return False
-        
-        # Check 3x3 box
-        box_row, box_col = (row // 3) * 3, (col // 3) * 3
-        if num in grid[box_row:box_row+3, box_col:box_col+3]:
-            return False
-        
-        return True
+    def _shuffled_lines(self) -> List[int]:
+        """Random order of the 9 rows (or columns) that keeps each band (or stack) together"""
+        bands = random.sample(range(3), 3)
+        return [band * 3 + line for band in bands for line in random.sample(range(3), 3)]
     
     def _remove_numbers(self, grid: np.ndarray, difficulty: Difficulty) -> np.ndarray:
         """Remove numbers from complete grid based on difficulty"""
         puzzle = grid.copy()
+        self.row_mask, self.col_mask, self.box_mask = _grid_masks(puzzle.ravel())
+        masks = (self.row_mask, self.col_mask, self.box_mask)
         
         # Number of cells to remove based on difficulty
         cells_to_remove = {
@@ -380,44 +661,43 @@ class SudokuGenerator:
             # Store original value
             original_value = puzzle[row, col]
             puzzle[row, col] = 0
+            self._toggle_mask(row, col, original_value)
             
             # Check if puzzle still has unique solution
-            if self._has_unique_solution(puzzle):
+            if self._has_unique_solution(puzzle, masks):
                 removed += 1
             else:
                 # Restore original value if no unique solution
                 puzzle[row, col] = original_value
+                self._toggle_mask(row, col, original_value)
         
         return puzzle
     
-    def _has_unique_solution(self, puzzle: np.ndarray) -> bool:
+    def _toggle_mask(self, row: int, col: int, value: int):
+        """Flip value's bit in the row, column and box masks when it is placed or removed"""
+        bit = 1 << (int(value) - 1)
+        self.row_mask[row] ^= bit
+        self.col_mask[col] ^= bit
+        self.box_mask[(row // 3) * 3 + col // 3] ^= bit
+    
+    def _has_unique_solution(self, puzzle: np.ndarray, masks: Optional[Tuple[np.ndarray, ...]] = None) -> bool:
         """Check if puzzle has exactly one solution"""
-        solver = SudokuSolver()
-        solver.load_puzzle(puzzle.tolist())
+        if _dlx is not None:
+            return _dlx.count_solutions(puzzle.ravel(), 2) == 1
         
-        # Count solutions
-        solutions = []
-        self._count_solutions(puzzle.copy(), solutions)
+        # The search leaves the grid untouched, so the puzzle is passed as-is
+        counter = [0]
+        self._count_solutions(puzzle, counter, masks=masks)
         
-        return len(solutions) == 1
+        return counter[0] == 1
     
-    def _count_solutions(self, grid: np.ndarray, solutions: List, max_solutions: int = 2):
-        """Count number of solutions (limited to max_solutions for efficiency)"""
-        if len(solutions) >= max_solutions:
+    def _count_solutions(self, grid: np.ndarray, counter: List[int], max_solutions: int = 2,
+                         masks: Optional[Tuple[np.ndarray, ...]] = None):
+        """Add the solutions of grid to counter[0] (limited to max_solutions for efficiency)"""
+        if counter[0] >= max_solutions:
             return
         
-        for i in range(9):
-            for j in range(9):
-                if grid[i, j] == 0:
-                    for num in range(1, 10):
-                        if self._is_safe(grid, i, j, num):
-                            grid[i, j] = num
-                            self._count_solutions(grid, solutions, max_solutions)
-                            grid[i, j] = 0
-                            if len(solutions) >= max_solutions:
-                                return
-                    return
-        
-        # If we reach here, grid is complete
-        solutions.append(grid.copy())
-
+        if HAVE_NUMBA:
+            counter[0] += _kernel_count(grid, max_solutions - counter[0], masks)
+        else:
+            counter[0] += self.dlx.count_solutions(grid, max_solutions - counter[0])
@@ -0,0 +1,231 @@
+"""
+Dancing Links (Algorithm X) exact-cover solver for Sudoku
+"""
+import numpy as np
+from typing import List, Tuple
+
+# Constraint columns: 81 cells, 81 row/value, 81 column/value and 81 box/value pairs
+N_COLUMNS = 324
+# One option per (row, col, value) placement
+N_OPTIONS = 729
+
+def option_columns(row: int, col: int, value: int) -> Tuple[int, int, int, int]:
+    """Return the four constraint columns covered by placing value at (row, col)"""
+    box = (row // 3) * 3 + col // 3
+    return (
+        row * 9 + col,
+        81 + row * 9 + value - 1,
+        162 + col * 9 + value - 1,
+        243 + box * 9 + value - 1
+    )
+
+class DLX:
+    """Exact-cover matrix for a 9x9 Sudoku stored as doubly-linked nodes.
+
+    Node 0 is the root, nodes 1..324 are the column headers and every option
+    contributes four nodes. Links are kept in parallel lists (L, R, U, D) and
+    each node records its column header (C) and option id (row_id).
+    """
+
+    def __init__(self):
+        n_nodes = 1 + N_COLUMNS + 4 * N_OPTIONS
+        self.L = [0] * n_nodes
+        self.R = [0] * n_nodes
+        self.U = list(range(n_nodes))
+        self.D = list(range(n_nodes))
+        self.C = [0] * n_nodes
+        self.row_id = [-1] * n_nodes
+        self.size = [0] * (N_COLUMNS + 1)
+        # First node of each option, used to preselect the givens
+        self.option_node = [0] * N_OPTIONS
+
+        # Circular header list: root <-> 1 <-> ... <-> 324 <-> root
+        for c in range(N_COLUMNS + 1):
+            self.L[c] = c - 1 if c > 0 else N_COLUMNS
+            self.R[c] = c + 1 if c < N_COLUMNS else 0
+
+        node = N_COLUMNS + 1
+        for row in range(9):
+            for col in range(9):
+                for value in range(1, 10):
+                    option = row * 81 + col * 9 + value - 1
+                    self.option_node[option] = node
+                    first = node
+                    for column in option_columns(row, col, value):
+                        column += 1  # Header nodes start at 1
+                        self.C[node] = column
+                        self.row_id[node] = option
+                        # Append to the bottom of the column
+                        self.U[node] = self.U[column]
+                        self.D[node] = column
+                        self.D[self.U[column]] = node
+                        self.U[column] = node
+                        self.size[column] += 1
+                        # Append to the end of the option's row
+                        self.L[node] = node - 1 if node > first else first + 3
+                        self.R[node] = node + 1 if node < first + 3 else first
+                        node += 1
+
+    def _cover(self, c: int):
+        """Remove column c and every option that intersects it"""
+        L, R, U, D, C, size = self.L, self.R, self.U, self.D, self.C, self.size
+        R[L[c]] = R[c]
+        L[R[c]] = L[c]
+        i = D[c]
+        while i != c:
+            j = R[i]
+            while j != i:
+                U[D[j]] = U[j]
+                D[U[j]] = D[j]
+                size[C[j]] -= 1
+                j = R[j]
+            i = D[i]
+
+    def _uncover(self, c: int):
+        """Restore column c, undoing _cover in reverse order"""
+        L, R, U, D, C, size = self.L, self.R, self.U, self.D, self.C, self.size
+        i = U[c]
+        while i != c:
+            j = L[i]
+            while j != i:
+                size[C[j]] += 1
+                U[D[j]] = j
+                D[U[j]] = j
+                j = L[j]
+            i = U[i]
+        R[L[c]] = c
+        L[R[c]] = c
+
+    def _select(self, node: int):
+        """Cover every column of the option containing node"""
+        self._cover(self.C[node])
+        self._select_rest(node)
+
+    def _deselect(self, node: int):
+        """Undo _select"""
+        self._deselect_rest(node)
+        self._uncover(self.C[node])
+
+    def _search(self, solution: List[int], results: List[List[int]], limit: int) -> bool:
+        """Algorithm X search; returns True once limit solutions were found"""
+        R, D, size = self.R, self.D, self.size
+        if R[0] == 0:
+            results.append(list(solution))
+            return len(results) >= limit
+
+        # Choose the column with the fewest remaining options (MRV). A column
+        # with one option is a forced move and one with none is a dead end,
+        # so either stops the scan immediately
+        best = R[0]
+        c = R[best]
+        while c != 0 and size[best] > 1:
+            if size[c] < size[best]:
+                best = c
+            c = R[c]
+        if size[best] == 0:
+            return False
+
+        self._cover(best)
+        r = D[best]
+        while r != best:
+            solution.append(self.row_id[r])
+            self._select_rest(r)
+            done = self._search(solution, results, limit)
+            self._deselect_rest(r)
+            solution.pop()
+            if done:
+                self._uncover(best)
+                return True
+            r = D[r]
+        self._uncover(best)
+        return False
+
+    def _count(self, count: int, limit: int) -> int:
+        """Algorithm X search that only counts; adds the solutions found to count, stopping at limit"""
+        R, D, size = self.R, self.D, self.size
+        if R[0] == 0:
+            return count + 1
+
+        best = R[0]
+        c = R[best]
+        while c != 0 and size[best] > 1:
+            if size[c] < size[best]:
+                best = c
+            c = R[c]
+        if size[best] == 0:
+            return count
+
+        self._cover(best)
+        r = D[best]
+        while r != best and count < limit:
+            self._select_rest(r)
+            count = self._count(count, limit)
+            self._deselect_rest(r)
+            r = D[r]
+        self._uncover(best)
+        return count
+
+    def _select_rest(self, node: int):
+        """Cover the columns of node's option other than its own"""
+        j = self.R[node]
+        while j != node:
+            self._cover(self.C[j])
+            j = self.R[j]
+
+    def _deselect_rest(self, node: int):
+        """Undo _select_rest"""
+        j = self.L[node]
+        while j != node:
+            self._uncover(self.C[j])
+            j = self.L[j]
+
+    def _preselect(self, grid: np.ndarray) -> Tuple[List[int], bool]:
+        """Select the givens of grid, returning the selected nodes and whether two givens conflict"""
+        # A given whose constraint is already covered conflicts with an
+        # earlier one and the puzzle has no solution
+        selected = []
+        covered = set()
+        for row in range(9):
+            for col in range(9):
+                value = int(grid[row][col])
+                if value == 0:
+                    continue
+                columns = option_columns(row, col, value)
+                if covered.intersection(columns):
+                    return selected, True
+                covered.update(columns)
+                node = self.option_node[row * 81 + col * 9 + value - 1]
+                self._select(node)
+                selected.append(node)
+        return selected, False
+
+    def _release(self, selected: List[int]):
+        """Deselect the givens chosen by _preselect"""
+        for node in reversed(selected):
+            self._deselect(node)
+
+    def solve(self, grid: np.ndarray, limit: int = 1) -> List[np.ndarray]:
+        """Return up to limit solutions of grid (0 marks an empty cell)"""
+        selected, conflict = self._preselect(grid)
+        results = []
+        if not conflict:
+            self._search([], results, limit)
+        self._release(selected)
+
+        solutions = []
+        for options in results:
+            solution = np.array(grid, dtype=int)
+            for option in options:
+                solution[option // 81, (option // 9) % 9] = option % 9 + 1
+            solutions.append(solution)
+        return solutions
+
+    def count_solutions(self, grid: np.ndarray, limit: int = 2) -> int:
+        """Count the solutions of grid, stopping once limit is reached.
+
+        Unlike solve this keeps no partial solutions and builds no grids.
+        """
+        selected, conflict = self._preselect(grid)
+        count = 0 if conflict else self._count(0, limit)
+        self._release(selected)
+        return count
@@ -2,9 +2,79 @@
 Interactive GUI for Sudoku solver and creator with educational features
 """
 import tkinter as tk
-from tkinter import ttk, messagebox, font
+from tkinter import ttk, messagebox
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
 import numpy as np
-from sudoku_core import SudokuSolver, SudokuGenerator, Difficulty, Technique
+from sudoku_core import SudokuSolver, SudokuGenerator, Difficulty, Technique, PEERS
+
+# Side of one grid cell on the canvas, in pixels
+CELL_SIZE = 50
+# Canvas offset of the grid, leaving room for the outer thick borders
+GRID_MARGIN = 2
+# Delay before highlighting a newly focused cell, so rapid focus changes redraw once
+HIGHLIGHT_DELAY_MS = 30
+# Cell text for each digit, with 0 shown as an empty cell
+DIGIT_TEXT = ("",) + tuple(str(d) for d in range(1, 10))
+# HL_MASK[idx] has bit p set for each cell p highlighted when cell idx is
+# focused: its 20 peers and the cell itself
+HL_MASK = [sum(1 << peer for peer in PEERS[idx].tolist()) | (1 << idx) for idx in range(81)]
+# How often a background puzzle generation is checked for completion
+POLL_INTERVAL_MS = 50
+# Characters accepted as cell input
+DIGIT_KEYS = frozenset('123456789')
+# Row and column steps for the arrow keys
+ARROW_STEPS = {'Up': (-1, 0), 'Down': (1, 0), 'Left': (0, -1), 'Right': (0, 1)}
+
+def _bits(mask):
+    """Yield the positions of the set bits of mask, lowest first"""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+# Contents of the Help > Techniques Guide window
+GUIDE_TEXT = """
+SUDOKU SOLVING TECHNIQUES GUIDE
+
+1. NAKED SINGLE
+   - A cell that has only one possible value
+   - Look for cells with only one candidate remaining
+   - Example: If a cell can only contain 5, place 5 there
+
+2. HIDDEN SINGLE
+   - A value that can only go in one cell within a row, column, or box
+   - Look for numbers that appear in only one cell in a unit
+   - Example: In a row, if only one cell can contain 7, place 7 there
+
+3. NAKED PAIR
+   - Two cells in the same unit that contain the same two candidates
+   - These candidates can be eliminated from other cells in the unit
+   - Example: Two cells both have candidates {3,7}, so 3 and 7 can be removed from other cells
+
+4. HIDDEN PAIR
+   - Two candidates that appear in only two cells within a unit
+   - Other candidates in those cells can be eliminated
+   - Example: If 2 and 8 only appear in two cells, remove other candidates from those cells
+
+5. POINTING PAIR/TRIPLE
+   - When candidates in a box are limited to one row or column
+   - Those candidates can be eliminated from the rest of the row/column
+   - Example: In a box, if 4 only appears in one row, remove 4 from other cells in that row
+
+6. BOX/LINE REDUCTION
+   - When candidates in a row/column are limited to one box
+   - Those candidates can be eliminated from the rest of the box
+   - Example: In a row, if 6 only appears in one box, remove 6 from other cells in that box
+
+TIPS FOR BEGINNERS:
+- Always start with naked singles and hidden singles
+- Look for the most constrained cells first
+- Use pencil marks to track candidates
+- Don't guess - use logic and techniques
+- Practice regularly to improve pattern recognition
+"""
 
 class SudokuGUI:
     """Main GUI application for Sudoku solver and creator"""
@@ -24,9 +94,25 @@ class SudokuGUI:
         # Initialize core components
         self.solver = SudokuSolver()
         self.generator = SudokuGenerator()
+        # Puzzles are generated on a worker thread so the window stays responsive
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._generate_future = None
         self.current_puzzle = None
         self.techniques_used = []
         self.current_step = 0
+        # Set when the grid changed since the solver last loaded it
+        self._grid_dirty = True
+        # Techniques found for the grid whose bytes are _techniques_key
+        self._techniques_key = None
+        self._techniques_cache = []
+        # Nesting depth of batched() blocks; redraws are flushed when it drops to 0
+        self._batch_depth = 0
+        # Pending after() id of a debounced highlight, None when nothing is scheduled
+        self._highlight_after = None
+        # Technique currently described in the control panel
+        self._shown_technique = None
+        # Techniques guide window, created on first use
+        self._guide_window = None
         
         # Create GUI elements
         self.create_widgets()
@@ -58,10 +144,9 @@ class SudokuGUI:
         # Generate menu
         generate_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label="Generate", menu=generate_menu)
-        generate_menu.add_command(label="Easy", command=lambda: self.generate_puzzle(Difficulty.EASY))
-        generate_menu.add_command(label="Medium", command=lambda: self.generate_puzzle(Difficulty.MEDIUM))
-        generate_menu.add_command(label="Hard", command=lambda: self.generate_puzzle(Difficulty.HARD))
-        generate_menu.add_command(label="Expert", command=lambda: self.generate_puzzle(Difficulty.EXPERT))
+        for difficulty in Difficulty:
+            generate_menu.add_command(label=difficulty.name.title(),
+                                      command=partial(self.generate_puzzle, difficulty))
         
         # Help menu
         help_menu = tk.Menu(menubar, tearoff=0)
@@ -92,42 +177,53 @@ class SudokuGUI:
         grid_frame = ttk.LabelFrame(parent, text="Sudoku Puzzle", padding="10")
         grid_frame.grid(row=0, column=0, padx=(0, 10), sticky=(tk.W, tk.E, tk.N, tk.S))
         
-        # Create 9x9 grid of entry widgets
-        self.cells = []
+        # The grid is drawn on one canvas: a rectangle and a text item per cell,
+        # stored at index row * 9 + col
+        size = 9 * CELL_SIZE + 2 * GRID_MARGIN
+        self.canvas = tk.Canvas(grid_frame, width=size, height=size, bg='white', highlightthickness=0)
+        self.canvas.grid(row=0, column=0)
+        self._rect_ids = []
+        self._text_ids = []
+        # Cells given by the loaded puzzle, drawn in black; all others are blue
+        self._given = np.zeros(81, dtype=bool)
+        # Index of the selected cell, None when no cell is selected
+        self._focus = None
+        # Bitmask of the highlighted cells (bit idx for cell idx) and each cell's fill
+        self._hl_state = 0
+        self._cell_fill = ['white'] * 81
+        # What the highlight shows: a (row, col) whose row, column and box are
+        # highlighted, a Technique whose cells are, or None
+        self._last_hl = None
+        # Digits shown on the canvas, kept in step by every write so reading the
+        # grid never has to query the canvas items
+        self._mirror = np.zeros((9, 9), dtype=np.int8)
         for i in range(9):
-            row = []
             for j in range(9):
-                cell = tk.Entry(
-                    grid_frame,
-                    width=3,
-                    font=('Arial', 16, 'bold'),
-                    justify='center',
-                    relief='solid',
-                    bd=1
-                )
-                cell.grid(row=i, column=j, padx=1, pady=1, ipady=5)
-                
-                # Add validation
-                cell.bind('<KeyPress>', lambda e, r=i, c=j: self.validate_input(e, r, c))
-                cell.bind('<FocusIn>', lambda e, r=i, c=j: self.on_cell_focus(r, c))
-                cell.bind('<FocusOut>', lambda e, r=i, c=j: self.on_cell_unfocus(r, c))
-                
-                row.append(cell)
-            self.cells.append(row)
+                x = GRID_MARGIN + j * CELL_SIZE
+                y = GRID_MARGIN + i * CELL_SIZE
+                self._rect_ids.append(self.canvas.create_rectangle(
+                    x, y, x + CELL_SIZE, y + CELL_SIZE, fill='white', outline='black'
+                ))
+                self._text_ids.append(self.canvas.create_text(
+                    x + CELL_SIZE // 2, y + CELL_SIZE // 2, text="", fill='blue', font=('Arial', 16, 'bold')
+                ))
+        
+        # One binding each for the whole grid: clicks select a cell, keys go to the selected cell
+        self.canvas.bind('<Button-1>', self.on_click)
+        self.canvas.bind('<KeyPress>', self.on_key)
+        self.canvas.bind('<FocusOut>', self.on_grid_unfocus)
         
         # Add thick borders for 3x3 boxes
         self.add_thick_borders()
     
     def add_thick_borders(self):
         """Add thick borders to separate 3x3 boxes"""
-        for i in range(9):
-            for j in range(9):
-                if i % 3 == 2:  # Bottom border of 3x3 box
-                    self.cells[i][j].configure(relief='solid', bd=2)
-                if j % 3 == 2:  # Right border of 3x3 box
-                    self.cells[i][j].configure(relief='solid', bd=2)
-                if i % 3 == 2 and j % 3 == 2:  # Corner
-                    self.cells[i][j].configure(relief='solid', bd=3)
+        # One line per box edge across the whole grid instead of a segment per cell
+        start, end = GRID_MARGIN, GRID_MARGIN + 9 * CELL_SIZE
+        for k in (3, 6, 9):
+            offset = GRID_MARGIN + k * CELL_SIZE
+            self.canvas.create_line(start, offset, end, offset, width=3)  # Bottom border of a band of boxes
+            self.canvas.create_line(offset, start, offset, end, width=3)  # Right border of a stack of boxes
     
     def create_control_panel(self, parent):
         """Create control panel with buttons and information"""
@@ -136,39 +232,24 @@ class SudokuGUI:
         
         # Difficulty selection
         ttk.Label(control_frame, text="Generate Puzzle:").pack(anchor=tk.W, pady=(0, 5))
-        difficulty_frame = ttk.Frame(control_frame)
-        difficulty_frame.pack(fill=tk.X, pady=(0, 10))
-        
-        ttk.Button(difficulty_frame, text="Easy", 
-                  command=lambda: self.generate_puzzle(Difficulty.EASY)).pack(side=tk.LEFT, padx=(0, 5))
-        ttk.Button(difficulty_frame, text="Medium", 
-                  command=lambda: self.generate_puzzle(Difficulty.MEDIUM)).pack(side=tk.LEFT, padx=(0, 5))
-        ttk.Button(difficulty_frame, text="Hard", 
-                  command=lambda: self.generate_puzzle(Difficulty.HARD)).pack(side=tk.LEFT, padx=(0, 5))
-        ttk.Button(difficulty_frame, text="Expert", 
-                  command=lambda: self.generate_puzzle(Difficulty.EXPERT)).pack(side=tk.LEFT)
+        self.create_button_row(control_frame, [
+            (difficulty.name.title(), partial(self.generate_puzzle, difficulty)) for difficulty in Difficulty
+        ])
         
         # Solve buttons
         ttk.Label(control_frame, text="Solving:").pack(anchor=tk.W, pady=(10, 5))
-        solve_frame = ttk.Frame(control_frame)
-        solve_frame.pack(fill=tk.X, pady=(0, 10))
-        
-        ttk.Button(solve_frame, text="Get Hint", 
-                  command=self.get_hint).pack(side=tk.LEFT, padx=(0, 5))
-        ttk.Button(solve_frame, text="Solve Step", 
-                  command=self.solve_step).pack(side=tk.LEFT, padx=(0, 5))
-        ttk.Button(solve_frame, text="Solve All", 
-                  command=self.solve_all).pack(side=tk.LEFT)
+        self.create_button_row(control_frame, [
+            ("Get Hint", self.get_hint),
+            ("Solve Step", self.solve_step),
+            ("Solve All", self.solve_all)
+        ])
         
         # Validation
         ttk.Label(control_frame, text="Validation:").pack(anchor=tk.W, pady=(10, 5))
-        validation_frame = ttk.Frame(control_frame)
-        validation_frame.pack(fill=tk.X, pady=(0, 10))
-        
-        ttk.Button(validation_frame, text="Check Puzzle", 
-                  command=self.check_puzzle).pack(side=tk.LEFT, padx=(0, 5))
-        ttk.Button(validation_frame, text="Clear", 
-                  command=self.clear_puzzle).pack(side=tk.LEFT)
+        self.create_button_row(control_frame, [
+            ("Check Puzzle", self.check_puzzle),
+            ("Clear", self.clear_puzzle)
+        ])
         
         # Technique information
         ttk.Label(control_frame, text="Current Technique:").pack(anchor=tk.W, pady=(10, 5))
@@ -178,9 +259,10 @@ class SudokuGUI:
         
         # Explanation
         ttk.Label(control_frame, text="Explanation:").pack(anchor=tk.W, pady=(10, 5))
-        self.explanation_text = tk.Text(control_frame, height=8, width=40, 
-                                       wrap=tk.WORD, font=('Arial', 10))
-        self.explanation_text.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
+        # Read-only, so a Label bound to a StringVar updates in one call without reflowing a Text
+        self._explanation_var = tk.StringVar()
+        ttk.Label(control_frame, textvariable=self._explanation_var, wraplength=300,
+                  justify=tk.LEFT, anchor='nw', font=('Arial', 10)).pack(fill=tk.BOTH, expand=True, pady=(0, 10))
         
         # Progress
         ttk.Label(control_frame, text="Progress:").pack(anchor=tk.W, pady=(10, 5))
@@ -188,105 +270,217 @@ class SudokuGUI:
         ttk.Label(control_frame, textvariable=self.progress_var).pack(anchor=tk.W)
         
         # Step navigation
-        step_frame = ttk.Frame(control_frame)
-        step_frame.pack(fill=tk.X, pady=(10, 0))
-        
-        ttk.Button(step_frame, text="Previous Step", 
-                  command=self.previous_step).pack(side=tk.LEFT, padx=(0, 5))
-        ttk.Button(step_frame, text="Next Step", 
-                  command=self.next_step).pack(side=tk.LEFT)
+        self.create_button_row(control_frame, [
+            ("Previous Step", self.previous_step),
+            ("Next Step", self.next_step)
+        ], pady=(10, 0))
         
         # Test button to verify GUI is working
-        test_frame = ttk.Frame(control_frame)
-        test_frame.pack(fill=tk.X, pady=(10, 0))
+        self.create_button_row(control_frame, [("Test GUI", self.test_gui)], pady=(10, 0))
+    
+    def create_button_row(self, parent, buttons, pady=(0, 10)):
+        """Pack a frame holding a row of buttons built from (text, command) pairs"""
+        frame = ttk.Frame(parent)
+        frame.pack(fill=tk.X, pady=pady)
         
-        ttk.Button(test_frame, text="Test GUI", 
-                  command=self.test_gui).pack(side=tk.LEFT)
+        last = len(buttons) - 1
+        for k, (text, command) in enumerate(buttons):
+            ttk.Button(frame, text=text, command=command).pack(side=tk.LEFT, padx=(0, 5) if k < last else 0)
+        return frame
     
     def validate_input(self, event, row, col):
         """Validate input in Sudoku cells"""
         char = event.char
-        if char and not (char.isdigit() and 1 <= int(char) <= 9):
+        if char and char not in DIGIT_KEYS:
             return "break"  # Ignore invalid input
         return None
     
+    def on_click(self, event):
+        """Select the cell under the mouse pointer"""
+        row = (event.y - GRID_MARGIN) // CELL_SIZE
+        col = (event.x - GRID_MARGIN) // CELL_SIZE
+        if 0 <= row < 9 and 0 <= col < 9:
+            self.select_cell(row, col)
+    
+    def select_cell(self, row, col):
+        """Move the keyboard focus to the cell at (row, col)"""
+        self._focus = row * 9 + col
+        self.canvas.focus_set()
+        self.on_cell_focus(row, col)
+    
+    def on_key(self, event):
+        """Handle key presses on the grid: digits fill the selected cell, arrows move the selection"""
+        if self._focus is None:
+            return None
+        row, col = divmod(self._focus, 9)
+        
+        if event.keysym in ARROW_STEPS:
+            d_row, d_col = ARROW_STEPS[event.keysym]
+            self.select_cell((row + d_row) % 9, (col + d_col) % 9)
+            return "break"
+        if event.keysym in ('BackSpace', 'Delete'):
+            self._set_cell(row, col, 0)
+            return "break"
+        if self.validate_input(event, row, col) == "break":
+            return "break"
+        if event.char:
+            self._set_cell(row, col, int(event.char))
+        return None
+    
+    def _set_cell(self, row, col, value):
+        """Show value in the cell at (row, col); 0 empties it"""
+        self.canvas.itemconfig(self._text_ids[row * 9 + col], text=DIGIT_TEXT[value])
+        self._mirror[row, col] = value
+        self._grid_dirty = True
+    
     def on_cell_focus(self, row, col):
         """Handle cell focus events"""
-        # Highlight related cells (same row, column, box)
-        self.highlight_related_cells(row, col)
+        # Highlight related cells (same row, column, box) once focus settles
+        self._cancel_highlight()
+        self._highlight_after = self.root.after(HIGHLIGHT_DELAY_MS, self._run_highlight, row, col)
     
     def on_cell_unfocus(self, row, col):
         """Handle cell unfocus events"""
+        self._cancel_highlight()
         self.clear_highlights()
     
+    def _cancel_highlight(self):
+        """Drop a scheduled highlight that has not run yet"""
+        if self._highlight_after is not None:
+            self.root.after_cancel(self._highlight_after)
+            self._highlight_after = None
+    
+    def _run_highlight(self, row, col):
+        """Run the highlight scheduled by on_cell_focus"""
+        self._highlight_after = None
+        self.highlight_related_cells(row, col)
+    
+    def on_grid_unfocus(self, event):
+        """Handle the grid losing keyboard focus"""
+        if self._focus is not None:
+            self.on_cell_unfocus(*divmod(self._focus, 9))
+    
     def highlight_related_cells(self, row, col):
         """Highlight cells in same row, column, and 3x3 box"""
-        self.clear_highlights()
-        
-        # Highlight row
-        for j in range(9):
-            self.cells[row][j].configure(bg='#e6f3ff')
+        if self._last_hl == (row, col):
+            return
+        self._last_hl = (row, col)
         
-        # Highlight column
-        for i in range(9):
-            self.cells[i][col].configure(bg='#e6f3ff')
+        # Only cells leaving the highlight are reset; _fill skips cells that keep their colour
+        idx = row * 9 + col
+        new = HL_MASK[idx]
+        self._clear_cells(self._hl_state & ~new)
+        self._hl_state = new
         
-        # Highlight 3x3 box
-        box_row, box_col = (row // 3) * 3, (col // 3) * 3
-        for i in range(box_row, box_row + 3):
-            for j in range(box_col, box_col + 3):
-                self.cells[i][j].configure(bg='#e6f3ff')
+        # The solver's peer table lists the 20 cells sharing a row, column or box
+        for peer in PEERS[idx].tolist():
+            self._fill(peer, '#e6f3ff')
         
         # Highlight current cell
-        self.cells[row][col].configure(bg='#b3d9ff')
+        self._fill(idx, '#b3d9ff')
+    
+    def _fill(self, idx, color):
+        """Fill the cell at idx with color unless it already has it"""
+        if self._cell_fill[idx] != color:
+            self.canvas.itemconfig(self._rect_ids[idx], fill=color)
+            self._cell_fill[idx] = color
+    
+    def _clear_cells(self, mask):
+        """Reset the cells whose bits are set in mask to white"""
+        for idx in _bits(mask):
+            self._fill(idx, 'white')
     
     def clear_highlights(self):
         """Clear all cell highlights"""
-        for i in range(9):
-            for j in range(9):
-                self.cells[i][j].configure(bg='white')
+        self._clear_cells(self._hl_state)
+        self._hl_state = 0
+        self._last_hl = None
     
     def generate_puzzle(self, difficulty: Difficulty):
         """Generate a new puzzle of specified difficulty"""
+        future = self._executor.submit(self.generator.generate_puzzle, difficulty)
+        self._generate_future = future
+        self.update_progress(f"Generating {difficulty.name.lower()} puzzle...")
+        self.root.after(POLL_INTERVAL_MS, self._poll_generate, future, difficulty)
+    
+    def _poll_generate(self, future, difficulty: Difficulty):
+        """Show the puzzle once a background generation finishes, or check again later"""
+        if future is not self._generate_future:
+            return  # A newer request replaced this one
+        if not future.done():
+            self.root.after(POLL_INTERVAL_MS, self._poll_generate, future, difficulty)
+            return
+        
+        self._generate_future = None
         try:
-            puzzle = self.generator.generate_puzzle(difficulty)
-            self.load_puzzle_to_grid(puzzle)
-            self.current_puzzle = puzzle
-            self.techniques_used = []
-            self.current_step = 0
-            self.update_progress(f"Generated {difficulty.name.lower()} puzzle")
-            self.clear_technique_info()
+            puzzle = future.result()
+            with self.batched():
+                self.load_puzzle_to_grid(puzzle)
+                self.current_puzzle = puzzle
+                self.techniques_used = []
+                self.current_step = 0
+                self.update_progress(f"Generated {difficulty.name.lower()} puzzle")
+                self.clear_technique_info()
         except Exception as e:
             messagebox.showerror("Error", f"Failed to generate puzzle: {str(e)}")
     
+    @contextmanager
+    def batched(self):
+        """Group a run of grid updates and flush pending redraws once at the end.
+        
+        Batches nest, and only the outermost one flushes.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.root.update_idletasks()
+    
     def load_puzzle_to_grid(self, puzzle):
         """Load puzzle data into the GUI grid"""
-        for i in range(9):
-            for j in range(9):
-                if puzzle[i][j] != 0:
-                    self.cells[i][j].delete(0, tk.END)
-                    self.cells[i][j].insert(0, str(puzzle[i][j]))
-                    self.cells[i][j].configure(fg='black', state='normal')
-                else:
-                    self.cells[i][j].delete(0, tk.END)
-                    self.cells[i][j].configure(fg='blue', state='normal')
+        old_values = self._mirror.ravel().copy()
+        self._mirror[:, :] = puzzle
+        self._grid_dirty = True
+        values = self._mirror.ravel()
+        given = values != 0
+        
+        # Only cells whose digit or colour changes need reconfiguring
+        changed = np.flatnonzero((values != old_values) | (given != self._given))
+        self._given = given
+        with self.batched():
+            for idx, value in zip(changed.tolist(), values[changed].tolist()):
+                self.canvas.itemconfig(self._text_ids[idx], text=DIGIT_TEXT[value],
+                                       fill='black' if value else 'blue')
     
     def get_puzzle_from_grid(self):
         """Get current puzzle state from GUI grid"""
-        puzzle = []
-        for i in range(9):
-            row = []
-            for j in range(9):
-                value = self.cells[i][j].get()
-                row.append(int(value) if value.isdigit() else 0)
-            puzzle.append(row)
-        return puzzle
+        return self._mirror.copy()
+    
+    def _ensure_solver_loaded(self):
+        """Load the grid into the solver unless it already holds this grid"""
+        if self._grid_dirty:
+            self.solver.load_puzzle(self.get_puzzle_from_grid())
+            self._grid_dirty = False
+    
+    def _solve_loaded(self):
+        """Solve the grid with techniques, returning the techniques used"""
+        key = self._mirror.tobytes()
+        if key == self._techniques_key:
+            return self._techniques_cache
+        
+        self._ensure_solver_loaded()
+        # Solving moves the solver away from the grid shown, even if it fails
+        self._grid_dirty = True
+        self._techniques_cache = self.solver.solve_with_techniques()
+        self._techniques_key = key
+        return self._techniques_cache
     
     def get_hint(self):
         """Get next hint for the user"""
         try:
-            puzzle = self.get_puzzle_from_grid()
-            self.solver.load_puzzle(puzzle)
+            self._ensure_solver_loaded()
             hint = self.solver.get_hint()
             
             if hint:
@@ -301,11 +495,8 @@ class SudokuGUI:
     def solve_step(self):
         """Solve one step of the puzzle"""
         try:
-            puzzle = self.get_puzzle_from_grid()
-            self.solver.load_puzzle(puzzle)
-            
             if not self.techniques_used:
-                self.techniques_used = self.solver.solve_with_techniques()
+                self.techniques_used = self._solve_loaded()
                 self.current_step = 0
             
             if self.current_step < len(self.techniques_used):
@@ -323,54 +514,60 @@ class SudokuGUI:
     def solve_all(self):
         """Solve the entire puzzle"""
         try:
-            puzzle = self.get_puzzle_from_grid()
-            self.solver.load_puzzle(puzzle)
-            self.techniques_used = self.solver.solve_with_techniques()
+            self.techniques_used = self._solve_loaded()
             
-            # Apply all techniques
-            for technique in self.techniques_used:
-                self.apply_technique_to_grid(technique)
-            
-            self.update_progress(f"Solved using {len(self.techniques_used)} techniques")
+            # Apply all techniques, redrawing once at the end
+            with self.batched():
+                for technique in self.techniques_used:
+                    self.apply_technique_to_grid(technique)
+                self.update_progress(f"Solved using {len(self.techniques_used)} techniques")
             messagebox.showinfo("Complete", f"Puzzle solved using {len(self.techniques_used)} techniques!")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to solve puzzle: {str(e)}")
     
     def apply_technique_to_grid(self, technique: Technique):
         """Apply a technique to the GUI grid"""
+        if not technique.value:
+            return  # Elimination techniques only remove candidates, no digits are placed
+        
+        # The technique records the digit it places, so the solver is not reloaded
         for row, col in technique.cells_affected:
-            if self.cells[row][col].get() == "":
-                # Find the value to place
-                puzzle = self.get_puzzle_from_grid()
-                self.solver.load_puzzle(puzzle)
-                candidates = self.solver._get_candidates(row, col)
-                if len(candidates) == 1:
-                    value = list(candidates)[0]
-                    self.cells[row][col].delete(0, tk.END)
-                    self.cells[row][col].insert(0, str(value))
+            if self._mirror[row, col] == 0:
+                self._set_cell(row, col, technique.value)
     
     def highlight_technique_cells(self, technique: Technique):
         """Highlight cells affected by a technique"""
-        self.clear_highlights()
+        if self._last_hl is technique:
+            return
+        
+        new = 0
         for row, col in technique.cells_affected:
-            self.cells[row][col].configure(bg='#ffeb3b')  # Yellow highlight
+            new |= 1 << (row * 9 + col)
+        self._clear_cells(self._hl_state & ~new)
+        self._hl_state = new
+        self._last_hl = technique
+        for idx in _bits(new):
+            self._fill(idx, '#ffeb3b')  # Yellow highlight
     
     def show_technique_info(self, technique: Technique):
         """Show technique information in the control panel"""
+        # Skip the panel update when stepping back onto the shown technique
+        if technique is self._shown_technique:
+            return
+        self._shown_technique = technique
         self.technique_label.configure(text=technique.name)
-        self.explanation_text.delete(1.0, tk.END)
-        self.explanation_text.insert(tk.END, f"{technique.description}\n\n{technique.explanation}")
+        self._explanation_var.set(f"{technique.description}\n\n{technique.explanation}")
     
     def clear_technique_info(self):
         """Clear technique information"""
+        self._shown_technique = None
         self.technique_label.configure(text="None")
-        self.explanation_text.delete(1.0, tk.END)
+        self._explanation_var.set("")
     
     def check_puzzle(self):
         """Check if current puzzle is valid"""
         try:
-            puzzle = self.get_puzzle_from_grid()
-            self.solver.load_puzzle(puzzle)
+            self._ensure_solver_loaded()
             
             if self.solver.is_valid():
                 if self.solver.is_solved():
@@ -384,11 +581,12 @@ class SudokuGUI:
     
     def clear_puzzle(self):
         """Clear the puzzle"""
-        for i in range(9):
-            for j in range(9):
-                self.cells[i][j].delete(0, tk.END)
-        self.clear_technique_info()
-        self.update_progress("Puzzle cleared")
+        with self.batched():
+            for i in range(9):
+                for j in range(9):
+                    self._set_cell(i, j, 0)
+            self.clear_technique_info()
+            self.update_progress("Puzzle cleared")
     
     def previous_step(self):
         """Go to previous solving step"""
@@ -429,55 +627,22 @@ class SudokuGUI:
     
     def show_techniques_guide(self):
         """Show techniques guide window"""
+        # The window is built once and hidden on close, so later opens just show it again
+        if self._guide_window is not None and self._guide_window.winfo_exists():
+            self._guide_window.deiconify()
+            self._guide_window.lift()
+            return
+        
         guide_window = tk.Toplevel(self.root)
         guide_window.title("Sudoku Techniques Guide")
         guide_window.geometry("600x500")
+        guide_window.protocol("WM_DELETE_WINDOW", guide_window.withdraw)
+        self._guide_window = guide_window
         
         text_widget = tk.Text(guide_window, wrap=tk.WORD, padx=10, pady=10)
         text_widget.pack(fill=tk.BOTH, expand=True)
         
-        guide_text = """
-SUDOKU SOLVING TECHNIQUES GUIDE
-
-1. NAKED SINGLE
-   - A cell that has only one possible value
-   - Look for cells with only one candidate remaining
-   - Example: If a cell can only contain 5, place 5 there
-
-2. HIDDEN SINGLE
-   - A value that can only go in one cell within a row, column, or box
-   - Look for numbers that appear in only one cell in a unit
-   - Example: In a row, if only one cell can contain 7, place 7 there
-
-3. NAKED PAIR
-   - Two cells in the same unit that contain the same two candidates
-   - These candidates can be eliminated from other cells in the unit
-   - Example: Two cells both have candidates {3,7}, so 3 and 7 can be removed from other cells
-
-4. HIDDEN PAIR
-   - Two candidates that appear in only two cells within a unit
-   - Other candidates in those cells can be eliminated
-   - Example: If 2 and 8 only appear in two cells, remove other candidates from those cells
-
-5. POINTING PAIR/TRIPLE
-   - When candidates in a box are limited to one row or column
-   - Those candidates can be eliminated from the rest of the row/column
-   - Example: In a box, if 4 only appears in one row, remove 4 from other cells in that row
-
-6. BOX/LINE REDUCTION
-   - When candidates in a row/column are limited to one box
-   - Those candidates can be eliminated from the rest of the box
-   - Example: In a row, if 6 only appears in one box, remove 6 from other cells in that box
-
-TIPS FOR BEGINNERS:
-- Always start with naked singles and hidden singles
-- Look for the most constrained cells first
-- Use pencil marks to track candidates
-- Don't guess - use logic and techniques
-- Practice regularly to improve pattern recognition
-        """
-        
-        text_widget.insert(tk.END, guide_text)
+        text_widget.insert(tk.END, GUIDE_TEXT)
         text_widget.configure(state='disabled')
     
     def test_gui(self):
@@ -499,7 +664,10 @@ TIPS FOR BEGINNERS:
     
     def run(self):
         """Start the GUI application"""
-        self.root.mainloop()
+        try:
+            self.root.mainloop()
+        finally:
+            self._executor.shutdown(wait=False)
 
 if __name__ == "__main__":
     app = SudokuGUI()